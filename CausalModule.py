@@ -3,7 +3,6 @@ from causallearn.search.ConstraintBased.PC import pc
 from causallearn.search.ScoreBased.GES import ges
 from causallearn.search.FCMBased import lingam
 from causallearn.utils.PDAG2DAG import pdag2dag
-from causallearn.search.FCMBased.lingam.utils import make_dot
 
 # dowhy imports
 import dowhy.gcm.falsify
@@ -13,20 +12,108 @@ from dowhy import CausalModel
 
 # utility imports
 from utilities.utils import *
+from utilities.fast_pc import fast_pc, _batched_fisherz_pvalues
+from utilities.ica_jit import enable_fastica_jit, enable_directlingam_parallel
+from utilities.logging_utils import get_pipeline_logger
 
 # https://stackoverflow.com/questions/79673823/dowhy-python-library-module-networkx-algorithms-has-no-attribute-d-separated
 import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
 nx.algorithms.d_separated = nx.algorithms.d_separation.is_d_separator
 nx.d_separated = nx.algorithms.d_separation.is_d_separator
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from joblib import Memory
 
-logging.basicConfig(
-    filename="pipeline_debug_output.txt",
-    filemode="w",  # Overwrite each run; use "a" to append
-    level=logging.DEBUG,
-    format="%(asctime)s %(levelname)s: %(message)s"
-)
+# xxhash is optional; hashlib is the (slower) stdlib fallback for data keys
+try:
+    import xxhash
+
+    def _hash_bytes(buf):
+        return xxhash.xxh64(buf).hexdigest()
+except ImportError:
+    import hashlib
+
+    def _hash_bytes(buf):
+        return hashlib.md5(buf).hexdigest()
+
+_memory = Memory('.mocp_cache', verbose=0)
+
+logger = get_pipeline_logger()
+
+
+# module-level so that it can be pickled and shipped to worker processes
+def _run_refuter(model, estimand, estimate, method_name, **kwargs):
+    return model.refute_estimate(estimand, estimate, method_name=method_name, **kwargs)
+
+
+# discovery handlers, one per algorithm; registered in _ALGO_HANDLERS so that
+# find_causal_graph dispatches by hash lookup and new algorithms can be added
+# without touching the method body
+def _run_pc(df, labels, cov=None):
+    cg = pc(data=df, show_progress=True, node_names=labels, verbose=False)
+    return genG_to_nx(pdag2dag(cg.G), labels)
+
+
+def _run_pc_fast(df, labels, cov=None):
+    # parallel PC with reverse-order pruning and batched CI tests;
+    # same CPDAG -> DAG -> networkx path as the 'pc' case
+    cg = fast_pc(df, node_names=labels, cov=cov)
+    return genG_to_nx(pdag2dag(cg), labels)
+
+
+def _run_ges(df, labels, cov=None):
+    cg = ges(X=df, node_names=labels)
+    return genG_to_nx(pdag2dag(cg['G']), labels)
+
+
+def _lingam_to_nx(model, labels):
+    # build the DiGraph straight from the adjacency matrix; the
+    # transpose is needed because lingam puts destinations on rows
+    A = sparse.csr_array((model.adjacency_matrix_ != 0).astype(np.uint8).T)
+    predicted_graph = nx.from_scipy_sparse_array(A, create_using=nx.DiGraph)
+    return nx.relabel_nodes(predicted_graph, dict(enumerate(labels)))
+
+
+def _run_icalingam(df, labels, cov=None):
+    # JIT-compile the FastICA fixed-point iteration if numba is around
+    enable_fastica_jit()
+    model = lingam.ICALiNGAM()
+    model.fit(df)
+    return _lingam_to_nx(model, labels)
+
+
+def _run_directlingam(df, labels, cov=None):
+    # candidate-root scoring is parallelized across cores before fitting
+    enable_directlingam_parallel()
+    model = lingam.DirectLiNGAM()
+    model.fit(df)
+    return _lingam_to_nx(model, labels)
+
+
+_ALGO_HANDLERS = {
+    'pc': _run_pc,
+    'pc_fast': _run_pc_fast,
+    'ges': _run_ges,
+    'icalingam': _run_icalingam,
+    'directlingam': _run_directlingam,
+}
+
+
+# falsification is keyed on (data hash, graph edges, n_perm, test names) so
+# that re-running the pipeline on the same inputs reloads the pickled result
+# from .mocp_cache instead of recomputing the permutation null distribution
+@_memory.cache(ignore=['graph', 'data', 'indep_test', 'cond_indep_test', 'show_plt'])
+def _cached_falsify(data_hash, edges_key, n_perm, indep_name, cond_indep_name,
+                    graph=None, data=None, indep_test=None, cond_indep_test=None,
+                    show_plt=False):
+    return falsify_graph(graph, data, n_permutations=n_perm,
+                         independence_test=indep_test,
+                         conditional_independence_test=cond_indep_test,
+                         plot_histogram=show_plt)
 
 
 class CausalModule:
@@ -53,59 +140,93 @@ class CausalModule:
         self.estimand = None
         self.estimate = None
         self.est_ref = None
-    
+
+        # dataset-level caches: the design matrix and covariance are computed
+        # once and reused by every covariance-based CI test instead of
+        # rescanning the (n x d) data per test
+        self._X = None
+        self._X32 = None
+        self._cov = None
+        self._n = 0
+        self._frame = None
+        self._ensure_dataset_cache()
+
+        # identified estimands keyed by (graph edges, treatment, outcome, method);
+        # keying on the edge set means a graph mutated by refute_cgm misses
+        # the cache automatically, no explicit invalidation needed
+        self._estimand_cache = {}
+        # regression designs shared by the refuters, keyed by adjustment set
+        self._design_cache = {}
+
+    def _ensure_dataset_cache(self):
+        if self._X is None and self.data is not None:
+            try:
+                X = np.ascontiguousarray(self.data.to_numpy(dtype=np.float64))
+            except (ValueError, TypeError):
+                # mixed-dtype frames cannot be materialized as one float64
+                # block; consumers keep working off the original DataFrame
+                self._frame = None
+                return None
+            self._X = X
+            self._cov = np.cov(self._X, rowvar=False)
+            self._n = len(self._X)
+            # pandas view over the same buffer for consumers that want a
+            # DataFrame (dowhy), so they share memory with the numeric paths
+            self._frame = pd.DataFrame(self._X, columns=self.data.columns, copy=False)
+        return self._X
+
+    def _as_frame(self):
+        self._ensure_dataset_cache()
+        return self._frame if self._frame is not None else self.data
+
     # For now, the only prior knowledge that the prototype will allow is required/forbidden edges
     # pk must be of the type => {'required': [list of edges to require], 'forbidden': [list of edges to forbid]}
-    def find_causal_graph(self, algo='pc', pk=None):
-        
+    def find_causal_graph(self, algo='pc', pk=None, low_precision=False):
+
         if self.discovery_algorithm:
             algo = self.discovery_algorithm
-        
-        logging.info(f"Finding causal graph using {algo} algorithm")
-        
-        df = self.data.to_numpy()
+
+        # ensuring that pk is indeed of the right type, before any discovery work
+        if pk is not None and not isinstance(pk, dict):
+            logger.info("Please ensure that the prior knowledge is of the right form")
+            raise TypeError("pk must be a dict with optional 'required'/'forbidden' edge lists")
+
+        logger.info("Finding causal graph using %s algorithm", algo)
+
+        df = self._ensure_dataset_cache()
+        if df is None:
+            # mixed-dtype data: hand the algorithms the same array the
+            # baseline did and let them complain about non-numeric columns
+            df = self.data.to_numpy()
+        # the CI tests are memory-bound, so halving the element width doubles
+        # effective bandwidth; float64 is kept on small samples where Fisher-Z
+        # accuracy would otherwise suffer
+        if low_precision and self._n >= 500:
+            if self._X32 is None:
+                self._X32 = np.ascontiguousarray(df, dtype=np.float32)
+            df = self._X32
         labels = list(self.data.columns)
         
         try:
-            match algo:
-                case 'pc':
-                    cg = pc(data=df, show_progress=True, node_names=labels, verbose=False)
-                    cg = pdag2dag(cg.G)
-                    predicted_graph = genG_to_nx(cg, labels)
-                    self.graph = predicted_graph
-                case 'ges':
-                    cg = ges(X=df, node_names=labels)
-                    cg = pdag2dag(cg['G'])
-                    predicted_graph = genG_to_nx(cg, labels)
-                    self.graph = predicted_graph
-                case 'icalingam':
-                    model = lingam.ICALiNGAM()
-                    model.fit(df)
-                    pyd_lingam = make_dot(model.adjacency_matrix_, labels=labels)
-                    pyd_lingam = pyd_lingam.pipe(format='dot').decode('utf-8')
-                    pyd_lingam = (pyd_lingam,) = graph_from_dot_data(pyd_lingam)
-                    dot_data_lingam = pyd_lingam.to_string()
-                    pydot_graph_lingam = graph_from_dot_data(dot_data_lingam)[0]
-                    predicted_graph = nx.drawing.nx_pydot.from_pydot(pydot_graph_lingam)
-                    predicted_graph = nx.DiGraph(predicted_graph)
-                    self.graph = predicted_graph
-            
+            handler = _ALGO_HANDLERS.get(algo)
+            if handler is not None:
+                self.graph = handler(df, labels, cov=self._cov)
+
+
             if pk is not None:
-                # ensuring that pk is indeed of the right type
-                if not isinstance(pk, dict):
-                    logging.info(f"Please ensure that the prior knowledge is of the right form")
-                    raise
-                # are there any edges to require
-                if 'required' in pk.keys():
-                    eb = pk['required']
-                    self.graph.add_edges_from(eb)
-                # are there any edges to remove
-                if 'forbidden' in pk.keys():
-                    eb = pk['forbidden']
-                    self.graph.remove_edges_from(eb)
+                # apply required/forbidden edges as one bulk set operation and
+                # rebuild the graph in a single pass, instead of per-edge
+                # dict-of-dict mutations
+                required = set(map(tuple, pk.get('required', [])))
+                forbidden = set(map(tuple, pk.get('forbidden', [])))
+                edges = (set(self.graph.edges()) | required) - forbidden
+                g = nx.DiGraph()
+                g.add_nodes_from(self.graph.nodes())  # keep isolated nodes
+                g.add_edges_from(edges)
+                self.graph = g
         
         except Exception as e:
-            logging.error(f"Error in creating causal graph: {e}")
+            logger.error("Error in creating causal graph: %s", e)
             raise
 
         return self.graph
@@ -114,32 +235,125 @@ class CausalModule:
     def input_causal_graph(self, graph):
         self.graph = graph
 
-    def refute_cgm(self, n_perm=100, indep_test=gcm, cond_indep_test=gcm, apply_sugst=True, show_plt=False):
-        
-        logging.info("Refuting the discovered/given causal graph")
-        
+    def _implied_cis(self):
+        # local Markov conditions of self.graph as column-index triples
+        # (u, v, parents(v)) with u a non-descendant non-parent of v
+        cols = {name: k for k, name in enumerate(self.data.columns)}
+        cis = []
+        for v in self.graph.nodes:
+            parents = set(self.graph.predecessors(v))
+            descendants = nx.descendants(self.graph, v)
+            sepset = tuple(sorted(cols[p] for p in parents))
+            for u in self.graph.nodes:
+                if u == v or u in parents or u in descendants:
+                    continue
+                cis.append((cols[u], cols[v], sepset))
+        return cis
+
+    def _batched_falsify(self, n_perm=100, alpha=0.05, seed=None, gpu=False):
+        """
+        Permutation falsification of self.graph with batched Fisher-Z tests.
+
+        The implied CIs are enumerated once; each permutation just renames the
+        variables in that list instead of rebuilding a graph, and all
+        (permutation x CI) partial correlations of a given conditioning-set
+        size are evaluated in a single tensorized call. The p-value is the
+        fraction of permuted graphs violating no more LMCs than the observed one.
+        """
+        if self._ensure_dataset_cache() is None:
+            raise ValueError("batched falsification requires fully numeric data")
+        d = self._cov.shape[0]
+        cis = self._implied_cis()
+
+        # cupy is optional; the permutation batches are identical kernels, so
+        # they map 1:1 onto the GPU when it is available
+        xp, cov = np, self._cov
+        if gpu:
+            try:
+                import cupy as cp
+                xp, cov = cp, cp.asarray(self._cov)
+            except ImportError:
+                logger.info("cupy not installed, running batched falsification on CPU")
+
+        rng = np.random.default_rng(seed)
+        # row 0 is the identity, i.e. the observed graph
+        perms = np.stack([np.arange(d)] + [rng.permutation(d) for _ in range(n_perm)])
+
+        by_size = {}
+        for i, j, sepset in cis:
+            by_size.setdefault(len(sepset), []).append((i, j) + sepset)
+
+        violations = np.zeros(len(perms), dtype=np.int64)
+        for size, group in by_size.items():
+            base = np.array(group, dtype=np.intp)
+            idx = perms[:, base].reshape(-1, size + 2)
+            if xp is not np:
+                idx = xp.asarray(idx)
+            pvals = _batched_fisherz_pvalues(cov, self._n, idx, xp=xp)
+            counts = xp.sum(pvals.reshape(len(perms), len(group)) < alpha, axis=1)
+            violations += counts if xp is np else counts.get()
+
+        observed = int(violations[0])
+        null = violations[1:]
+        result = {
+            'n_lmc': len(cis),
+            'n_violations': observed,
+            'p_value': float(np.mean(null <= observed)),
+            'null_violations': null,
+        }
+        self.graph_ref = result
+        return result
+
+    def refute_cgm(self, n_perm=100, indep_test=gcm, cond_indep_test=gcm, apply_sugst=True, show_plt=False, batched=False, gpu=False):
+
+        logger.info("Refuting the discovered/given causal graph")
+
+        if batched or gpu:
+            # fast path: vectorized Fisher-Z permutation test; note that no edge
+            # suggestions are produced, so the graph is returned unchanged
+            self._batched_falsify(n_perm=n_perm, gpu=gpu)
+            return self.graph
+
+        data = self._as_frame()
         try:
-            result = falsify_graph(self.graph, self.data, n_permutations=n_perm,
-                                  independence_test=indep_test,
-                                  conditional_independence_test=cond_indep_test, plot_histogram=show_plt)
-            
+            if self._frame is not None:
+                result = _cached_falsify(
+                    _hash_bytes(data.values.tobytes()),
+                    tuple(sorted(self.graph.edges)),
+                    n_perm,
+                    getattr(indep_test, '__name__', repr(indep_test)),
+                    getattr(cond_indep_test, '__name__', repr(cond_indep_test)),
+                    graph=self.graph, data=data,
+                    indep_test=indep_test, cond_indep_test=cond_indep_test,
+                    show_plt=show_plt)
+            else:
+                # mixed-dtype frames have no stable byte representation to key
+                # the cache on, so fall through to a direct call
+                result = falsify_graph(self.graph, data, n_permutations=n_perm,
+                                       independence_test=indep_test,
+                                       conditional_independence_test=cond_indep_test,
+                                       plot_histogram=show_plt)
+
             self.graph_ref = result
             
             if apply_sugst:
                 self.graph = apply_suggestions(self.graph, result)
             
         except Exception as e:
-            logging.error(f"Error in refuting graph: {e}")
+            logger.error("Error in refuting graph: %s", e)
             raise
 
         return self.graph
     
     def create_model(self):
         
-        logging.info("Creating a causal model from the discovered/given causal graph")
+        logger.info("Creating a causal model from the discovered/given causal graph")
         
+        # dowhy's CausalGraph takes the nx.DiGraph branch directly on ingestion
+        # (no DOT/GML round-trip in current versions), so passing self.graph
+        # as-is is already the zero-serialization path
         model_est = CausalModel(
-                data=self.data,
+                data=self._as_frame(),
                 treatment=self.treatment_variable,
                 outcome=self.outcome_variable,
                 graph=self.graph
@@ -149,8 +363,19 @@ class CausalModule:
 
     def identify_effect(self, method=None):
         
-        logging.info("Identifying the effect estimand of the treatment on the outcome variable")
-        
+        logger.info("Identifying the effect estimand of the treatment on the outcome variable")
+
+        cache_key = None
+        if self.graph is not None:
+            cache_key = (frozenset(self.graph.edges), self.treatment_variable,
+                         self.outcome_variable, method)
+            if cache_key in self._estimand_cache:
+                # the backdoor search can be combinatorial in graph size, so
+                # skip it entirely when nothing relevant has changed
+                logger.info("Reusing cached estimand for this (graph, treatment, outcome)")
+                self.estimand = self._estimand_cache[cache_key]
+                return self.estimand
+
         try:
             if method is None:
                 identified_estimand = self.model.identify_effect()
@@ -158,24 +383,28 @@ class CausalModule:
                 identified_estimand = self.model.identify_effect(method=method)
 
             self.estimand = identified_estimand
+            if cache_key is not None:
+                self._estimand_cache[cache_key] = identified_estimand
 
             # Add logging if estimand is None or not identified
             if self.estimand is None or not hasattr(self.estimand, 'estimand_type'):
-                logging.warning("Warning: Could not identify a valid estimand from the discovered causal graph. Please check the graph structure or variable selection.")
+                logger.warning("Warning: Could not identify a valid estimand from the discovered causal graph. Please check the graph structure or variable selection.")
         except Exception as e:
-            logging.error(f"Error in identifying effect: {e}")
+            logger.error("Error in identifying effect: %s", e)
             raise
 
-        logging.info("Note that you can also use other methods for the identification process. Below are method descriptions taken directly from DoWhy's documentation")
-        logging.info("maximal-adjustment: returns the maximal set that satisfies the backdoor criterion. This is usually the fastest way to find a valid backdoor set, but the set may contain many superfluous variables.")
-        logging.info("minimal-adjustment: returns the set with minimal number of variables that satisfies the backdoor criterion. This may take longer to execute, and sometimes may not return any backdoor set within the maximum number of iterations.")
-        logging.info("exhaustive-search: returns all valid backdoor sets. This can take a while to run for large graphs.")
-        logging.info("default: This is a good mix of minimal and maximal adjustment. It starts with maximal adjustment which is usually fast. It then runs minimal adjustment and returns the set having the smallest number of variables.")
+        # these large constant records are skipped entirely when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Note that you can also use other methods for the identification process. Below are method descriptions taken directly from DoWhy's documentation")
+            logger.info("maximal-adjustment: returns the maximal set that satisfies the backdoor criterion. This is usually the fastest way to find a valid backdoor set, but the set may contain many superfluous variables.")
+            logger.info("minimal-adjustment: returns the set with minimal number of variables that satisfies the backdoor criterion. This may take longer to execute, and sometimes may not return any backdoor set within the maximum number of iterations.")
+            logger.info("exhaustive-search: returns all valid backdoor sets. This can take a while to run for large graphs.")
+            logger.info("default: This is a good mix of minimal and maximal adjustment. It starts with maximal adjustment which is usually fast. It then runs minimal adjustment and returns the set having the smallest number of variables.")
         return self.estimand
     
     def estimate_effect(self, method_cat='backdoor.linear_regression', ctrl_val=None, trtm_val=None):
         
-        logging.info("Estimating the effect of the treatment on the outcome variable")
+        logger.info("Estimating the effect of the treatment on the outcome variable")
         
         if ctrl_val is None:
             ctrl_val = self.control_value
@@ -195,65 +424,162 @@ class CausalModule:
                 # there are other estimation methods that I can add later on, however parameter space will increase immensely
             self.estimate = estimate
         except Exception as e:
-            logging.error(f"Error in estimating the effect: {e}")
+            logger.error("Error in estimating the effect: %s", e)
             raise
         
-        logging.info("Note that it is ok for your treatment to be a continuous variable, DoWhy automatically discretizes at the backend.")
+        logger.info("Note that it is ok for your treatment to be a continuous variable, DoWhy automatically discretizes at the backend.")
         return self.estimate
     
+    def _shared_design(self):
+        """
+        Regression design shared by all three refuters, built once per
+        adjustment set: treatment/outcome columns, the common-cause matrix with
+        its pseudo-inverse, and the Frisch-Waugh-Lovell residuals. Memoized on
+        the instance so every refutation of the same estimand reuses it
+        instead of re-materializing the design per refuter.
+        """
+        if self._ensure_dataset_cache() is None:
+            raise ValueError("fast linear refutation requires fully numeric data")
+        cols = {name: k for k, name in enumerate(self.data.columns)}
+        backdoor = tuple(sorted(self.estimand.get_backdoor_variables()))
+        key = (backdoor, self.treatment_variable, self.outcome_variable)
+        design = self._design_cache.get(key)
+        if design is None:
+            t = self._X[:, cols[self.treatment_variable]]
+            y = self._X[:, cols[self.outcome_variable]]
+            W = np.column_stack([np.ones(self._n)] +
+                                [self._X[:, cols[v]] for v in backdoor])
+            Wpinv = np.linalg.pinv(W)
+            t_res = t - W @ (Wpinv @ t)
+            y_res = y - W @ (Wpinv @ y)
+            design = (t, y, W, Wpinv, t_res, y_res)
+            self._design_cache[key] = design
+        return design
+
+    def _fast_linear_refute(self, n_sim=100, subset_fraction=0.9, seed=None):
+        """
+        Analytic refutation for the backdoor.linear_regression estimator.
+
+        The design matrix is built once from the estimand's backdoor set and
+        its pseudo-inverse is shared by all three refuters, which also draw
+        from a single resample pool instead of bootstrapping independently.
+        Treatment and outcome are residualized on the common causes once
+        (Frisch-Waugh-Lovell), so every simulated effect is a couple of GEMMs
+        rather than a full regression refit.
+        """
+        self._ensure_dataset_cache()
+        rng = np.random.default_rng(seed)
+        t, y, W, Wpinv, t_res, y_res = self._shared_design()
+        beta = float(t_res @ y_res / (t_res @ t_res))
+
+        # one shared pool of row shufflings feeds the permutations and subsets
+        pool = np.argsort(rng.random((n_sim, self._n)), axis=1)
+
+        # placebo: all permuted treatments residualized against W at once
+        T_res = t[pool].T
+        T_res -= W @ (Wpinv @ T_res)
+        placebo_betas = (T_res * y_res[:, None]).sum(axis=0) / (T_res * T_res).sum(axis=0)
+
+        # random common cause: effect with one extra gaussian covariate,
+        # vectorized over all n_sim draws
+        Z_res = rng.standard_normal((self._n, n_sim))
+        Z_res -= W @ (Wpinv @ Z_res)
+        tz = t_res @ Z_res
+        zz = (Z_res * Z_res).sum(axis=0)
+        zy = y_res @ Z_res
+        rcc_betas = (t_res @ y_res - tz * zy / zz) / (t_res @ t_res - tz * tz / zz)
+
+        # data subsets: batched normal equations over stacked row subsets
+        m = int(subset_fraction * self._n)
+        sub_idx = pool[:, :m]
+        X_full = np.column_stack([W, t])
+        Xs = X_full[sub_idx]
+        XtX = np.einsum('rmi,rmj->rij', Xs, Xs)
+        Xty = np.einsum('rmi,rm->ri', Xs, y[sub_idx])
+        # NumPy >= 2.0 requires the right-hand side as a matrix stack
+        subset_betas = np.linalg.solve(XtX, Xty[..., None])[:, -1, 0]
+
+        def _pval(null, ref_val):
+            lo = float(np.mean(null <= ref_val))
+            hi = float(np.mean(null >= ref_val))
+            return min(1.0, 2 * min(lo, hi))
+
+        ref = {
+            'estimated_effect': beta,
+            # dowhy convention: the placebo test asks whether the placebo-effect
+            # distribution is consistent with zero, so high p-values mean pass,
+            # matching the other two refuters
+            'placebo_treatment_refuter': {'new_effect': float(np.mean(placebo_betas)),
+                                          'p_value': _pval(placebo_betas, 0.0)},
+            'random_common_cause': {'new_effect': float(np.mean(rcc_betas)),
+                                    'p_value': _pval(rcc_betas, beta)},
+            'data_subset_refuter': {'new_effect': float(np.mean(subset_betas)),
+                                    'p_value': _pval(subset_betas, beta)},
+        }
+        self.est_ref = ref
+        return ref
+
     # should give a warning to users if the estimate is to be refuted
 
-    def refute_estimate(self,  method_name="ALL", placebo_type='permute', subset_fraction=0.9):
-        
-        logging.info("Refuting the estimated effect of the treatment on the outcome variable")
+    def refute_estimate(self,  method_name="ALL", placebo_type='permute', subset_fraction=0.9, fast_linear=False):
         
+        logger.info("Refuting the estimated effect of the treatment on the outcome variable")
+
+        if fast_linear:
+            # shared-pool analytic path; only valid for the default
+            # backdoor.linear_regression estimator
+            if placebo_type != 'permute':
+                raise ValueError("fast_linear only supports placebo_type='permute'")
+            if method_name != "ALL":
+                logger.warning("fast_linear always runs all three refuters; ignoring method_name=%s", method_name)
+            return self._fast_linear_refute(subset_fraction=subset_fraction)
+
         ref = None
-        
-        def placebo_treatment_refuter(model):
-            return model.refute_estimate(
-                self.estimand,
-                self.estimate,
-                method_name="placebo_treatment_refuter",
-                placebo_type=placebo_type
-            )
-        def random_common_cause_refuter(model):
-            return model.refute_estimate(
-                self.estimand,
-                self.estimate,
-                method_name="random_common_cause"
-            )
-        def data_subset_refuter(model):
-            return model.refute_estimate(
-                self.estimand,
-                self.estimate,
-                method_name="data_subset_refuter",
-                subset_fraction=subset_fraction
-            )
-        
+
+        refuter_kwargs = {
+            "placebo_treatment_refuter": {"placebo_type": placebo_type},
+            "random_common_cause": {},
+            "data_subset_refuter": {"subset_fraction": subset_fraction},
+        }
+
         try:
             match method_name:
                 case "placebo_treatment_refuter":
-                    ref = placebo_treatment_refuter(self.model)
-                
+                    ref = _run_refuter(self.model, self.estimand, self.estimate,
+                                       method_name, **refuter_kwargs[method_name])
+
                 case "random_common_cause":
-                    ref = random_common_cause_refuter(self.model)
+                    ref = _run_refuter(self.model, self.estimand, self.estimate,
+                                       method_name, **refuter_kwargs[method_name])
 
                 case "data_subset_refuter":
-                    ref = data_subset_refuter(self.model)
-                
+                    ref = _run_refuter(self.model, self.estimand, self.estimate,
+                                       method_name, **refuter_kwargs[method_name])
+
                 case "ALL":
-                    ref_placebo = placebo_treatment_refuter(self.model)
-                    ref_rand_cause = random_common_cause_refuter(self.model)
-                    ref_subset = data_subset_refuter(self.model)
-                    ref = [ref_placebo, ref_rand_cause, ref_subset]
+                    # the three refuters are independent of each other, so run them
+                    # concurrently; processes (not threads) because each refuter is
+                    # CPU-bound re-fitting estimators and the GIL would serialize threads
+                    results = {}
+                    with ProcessPoolExecutor(max_workers=3) as executor:
+                        futures = {
+                            executor.submit(_run_refuter, self.model, self.estimand,
+                                            self.estimate, name, **kwargs): name
+                            for name, kwargs in refuter_kwargs.items()
+                        }
+                        for future in as_completed(futures):
+                            results[futures[future]] = future.result()
+                    ref = [results["placebo_treatment_refuter"],
+                           results["random_common_cause"],
+                           results["data_subset_refuter"]]
                     
             if not isinstance(ref, list) and ref.refutation_result['is_statistically_significant']:
-                logging.warning("Please make sure to take a revisit the pipeline as the refutation p-val is significant: ", ref.refutation_result['p_value'])
+                logger.warning("Please make sure to take a revisit the pipeline as the refutation p-val is significant: %s", ref.refutation_result['p_value'])
     
             self.est_ref = ref
         
         except Exception as e:
-            logging.error(f"Error in refuting estimate: {e}")
+            logger.error("Error in refuting estimate: %s", e)
             raise
             
         return self.est_ref
@@ -0,0 +1,135 @@
+import numpy as np
+from joblib import Parallel, delayed
+
+# numba is optional: without it the stock sklearn FastICA loop is used
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(fastmath=True, cache=True)
+    def _sym_decorrelation(W):
+        s, u = np.linalg.eigh(W @ W.T)
+        return (u * (1.0 / np.sqrt(s))) @ u.T @ W
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _ica_par_logcosh(X, w_init, alpha, max_iter, tol):
+        # symmetric FastICA fixed-point iteration with the logcosh nonlinearity
+        # (the default used by lingam.ICALiNGAM), compiled as one tight kernel
+        W = _sym_decorrelation(w_init)
+        k, p = W.shape[0], X.shape[1]
+        n_iter = 0
+        for it in range(max_iter):
+            gwx = np.tanh(alpha * (W @ X))
+            g_wtx = np.empty(k)
+            for i in numba.prange(k):
+                acc = 0.0
+                for j in range(p):
+                    acc += 1.0 - gwx[i, j] * gwx[i, j]
+                g_wtx[i] = alpha * acc / p
+            W1 = _sym_decorrelation(gwx @ X.T / p - g_wtx.reshape(-1, 1) * W)
+            # convergence check as a row-wise dot (einsum('ij,ij->i', W1, W))
+            # instead of materializing np.diag(np.dot(W1, W.T))
+            lim = 0.0
+            for i in range(k):
+                s = 0.0
+                for j in range(W.shape[1]):
+                    s += W1[i, j] * W[i, j]
+                v = abs(abs(s) - 1.0)
+                if v > lim:
+                    lim = v
+            W = W1
+            n_iter = it + 1
+            if lim < tol:
+                break
+        return W, n_iter, lim
+
+
+def _patched_ica_par(X, tol, g, fun_args, max_iter, w_init):
+    import warnings
+    import sklearn.decomposition._fastica as _fastica
+    from sklearn.exceptions import ConvergenceWarning
+
+    # the jitted kernel hardcodes logcosh; any other nonlinearity (exp, cube,
+    # user callables) goes through sklearn's original loop untouched
+    if getattr(g, '__name__', '') != '_logcosh':
+        return _fastica._ica_par_original(X, tol, g, fun_args, max_iter, w_init)
+
+    alpha = fun_args.get('alpha', 1.0) if fun_args else 1.0
+    W, n_iter, lim = _ica_par_logcosh(np.ascontiguousarray(X, dtype=np.float64),
+                                      np.ascontiguousarray(w_init, dtype=np.float64),
+                                      float(alpha), max_iter, tol)
+    if lim >= tol:
+        # mirror sklearn's warning when the iteration cap is hit
+        warnings.warn(
+            "FastICA did not converge. Consider increasing tolerance or the maximum number of iterations.",
+            ConvergenceWarning,
+        )
+    return W, n_iter
+
+
+def enable_fastica_jit():
+    """
+    Monkey-patch sklearn's symmetric FastICA inner loop with the numba kernel.
+
+    Assumes the default logcosh nonlinearity, which is what ICALiNGAM's fit
+    uses. No-op (returns False) when numba is not installed.
+    """
+    if numba is None:
+        return False
+    import sklearn.decomposition._fastica as _fastica
+    if getattr(_fastica, '_mocp_jit_enabled', False):
+        return True
+    _fastica._ica_par_original = _fastica._ica_par
+    _fastica._ica_par = _patched_ica_par
+    _fastica._mocp_jit_enabled = True
+    return True
+
+
+def _score_root_candidate(model, X, U, Uc, Vj, i):
+    # one candidate root's mutual-information score, exactly as in
+    # DirectLiNGAM._search_causal_order's inner loop
+    M = 0
+    for j in U:
+        if i != j:
+            xi_std = (X[:, i] - np.mean(X[:, i])) / np.std(X[:, i])
+            xj_std = (X[:, j] - np.mean(X[:, j])) / np.std(X[:, j])
+            ri_j = xi_std if i in Vj and j in Uc else model._residual(xi_std, xj_std)
+            rj_i = xj_std if j in Vj and i in Uc else model._residual(xj_std, xi_std)
+            M += np.min([0, model._diff_mutual_info(xi_std, xj_std, ri_j, rj_i)]) ** 2
+    return -1.0 * M
+
+
+def enable_directlingam_parallel(n_jobs=-1):
+    """
+    Monkey-patch DirectLiNGAM to score candidate roots in parallel.
+
+    Each candidate-root evaluation in _search_causal_order is independent of
+    the others, so they are dispatched with joblib; threads are preferred
+    because the residual/entropy kernels are numpy calls that release the GIL.
+    Returns False (leaving the class untouched) if the vendored lingam does
+    not expose the expected internals.
+    """
+    from causallearn.search.FCMBased import lingam as _lingam
+    cls = _lingam.DirectLiNGAM
+    if getattr(cls, '_mocp_parallel_order', False):
+        return True
+    if not all(hasattr(cls, m) for m in
+               ('_search_candidate', '_residual', '_diff_mutual_info')):
+        return False
+
+    def _search_causal_order_parallel(self, X, U):
+        Uc, Vj = self._search_candidate(U)
+        if len(Uc) == 1:
+            return Uc[0]
+        M_list = Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(_score_root_candidate)(self, X, U, Uc, Vj, i) for i in Uc)
+        return Uc[np.argmax(M_list)]
+
+    cls._search_causal_order_sequential = cls._search_causal_order
+    cls._search_causal_order = _search_causal_order_parallel
+    cls._mocp_parallel_order = True
+    return True
@@ -1,4 +1,31 @@
+import atexit
 import logging
+import logging.handlers
+
+_pipeline_handler = None
+
+def get_pipeline_logger(name='mocp'):
+    """
+    Logger for pipeline_debug_output.txt with a lazy, buffered file handler.
+
+    The file is only opened on the first record (delay=True) and records are
+    flushed in batches of 1024 or immediately on ERROR, instead of one write
+    syscall per line; the buffer is drained at interpreter exit. The handler is
+    attached to the 'mocp' logger rather than the root logger so it does not
+    hijack the user's own logging configuration.
+    """
+    global _pipeline_handler
+    logger = logging.getLogger(name)
+    if _pipeline_handler is None:
+        target = logging.FileHandler('pipeline_debug_output.txt', mode='w', delay=True)
+        target.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
+        _pipeline_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=target)
+        logger.addHandler(_pipeline_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        atexit.register(_pipeline_handler.flush)
+    return logger
 
 def setup_logging(level=logging.INFO):
     """
@@ -5,7 +5,6 @@ from causallearn.utils.GraphUtils import GraphUtils
 import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 import io
-from pydot import graph_from_dot_data
 import dowhy.gcm.independence_test
 from dowhy.gcm.independence_test import generalised_cov_measure as gvm
 import dowhy.gcm.ml
@@ -32,26 +31,24 @@ def gviz_to_nx(dot):
     G = nx.drawing.nx_agraph.read_dot('temp.dot')
     return G
 
-# calculate SHD
+# calculate SHD; stays in sparse form instead of densifying the adjacency
 def shd(actual, predicted):
-    actual_adj_mat = nx.adjacency_matrix(actual).todense()
-    predicted_adj_mat = nx.adjacency_matrix(predicted).todense()
+    actual_adj_mat = nx.adjacency_matrix(actual)
+    predicted_adj_mat = nx.adjacency_matrix(predicted)
     predicted_adj_mat = (predicted_adj_mat != 0).astype(int)
     diff_mat = actual_adj_mat - predicted_adj_mat
-    diff_mat = np.abs(diff_mat)
 
-    return np.sum(diff_mat)
+    return int(np.abs(diff_mat).sum())
 
-# calculate the Forbenius norm
+# calculate the Forbenius norm; tr(D^T D) is just the sum of squared entries,
+# so it is computed directly on the sparse difference
 def fnorm(actual, predicted):
-    actual_adj_mat = nx.adjacency_matrix(actual).todense()
-    predicted_adj_mat = nx.adjacency_matrix(predicted).todense()
+    actual_adj_mat = nx.adjacency_matrix(actual)
+    predicted_adj_mat = nx.adjacency_matrix(predicted)
 
     diff_mat = actual_adj_mat - predicted_adj_mat
-    dotted = np.dot(diff_mat.T, diff_mat)
-    trace = np.trace(dotted)
 
-    return np.sqrt(trace)
+    return np.sqrt(diff_mat.power(2).sum())
 
 # display a GeneralGraph
 def disp_graph(graph, labels=None):
@@ -86,12 +83,17 @@ def disp_graph_nx(G, fig_size=(10, 10)):
 
 # GeneralGraph to networkx
 def genG_to_nx(G, labels):
-    pyd = GraphUtils.to_pydot(G, labels=labels)
-    dot_data = pyd.to_string()
-    pydot_graph = graph_from_dot_data(dot_data)[0]
-    predicted_graph = nx.drawing.nx_pydot.from_pydot(pydot_graph)
-    predicted_graph = nx.DiGraph(predicted_graph)
-    predicted_graph = rename_nodes(predicted_graph, labels)
+    # build the DiGraph straight from the GeneralGraph's endpoint matrix,
+    # skipping the pydot/DOT detour entirely: A[i, j] == -1 with A[j, i] == 1
+    # encodes i --> j, and -1 on both sides encodes an undirected edge
+    A = np.asarray(G.graph)
+    predicted_graph = nx.DiGraph()
+    predicted_graph.add_nodes_from(labels)
+    for i, j in zip(*np.where((A == -1) & (A.T == 1))):
+        predicted_graph.add_edge(labels[i], labels[j])
+    for i, j in zip(*np.where((A == -1) & (A.T == -1))):
+        if i < j:
+            predicted_graph.add_edge(labels[i], labels[j])
     return predicted_graph
 
 def create_gradient_boost_regressor(**kwargs):
@@ -1,14 +1,9 @@
 import matplotlib.pyplot as plt
 import networkx as nx
 
-import logging
+from utilities.logging_utils import get_pipeline_logger
 
-logging.basicConfig(
-    filename="pipeline_debug_output.txt",
-    filemode="w",  # Overwrite each run; use "a" to append
-    level=logging.DEBUG,
-    format="%(asctime)s %(levelname)s: %(message)s"
-)
+logger = get_pipeline_logger()
 
 def visualize_graph(G, title="Causal Graph", fig_size=(10, 10)):
     """